@@ -14,9 +14,11 @@
 """TensorAdapter."""
 
 import abc
+import collections
+from concurrent import futures
 import functools
 import typing
-from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Text, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
@@ -29,11 +31,36 @@ from tensorflow_metadata.proto.v0 import schema_pb2
 
 TensorRepresentations = Dict[Text, schema_pb2.TensorRepresentation]
 
+# ToBatchTensors() only dispatches the conversion to a thread pool when there
+# are more tensors than this. For fewer tensors the dispatching overhead
+# outweighs the gain.
+_MAX_TENSORS_FOR_SERIAL_CONVERSION = 4
+
+# TF constructors used for every batch, bound once to spare the module
+# attribute lookups.
+_ConvertToTensor = tf.convert_to_tensor
+_SparseTensor = tf.sparse.SparseTensor
+_SparseTensorValue = tf.compat.v1.SparseTensorValue
+_RaggedTensorValue = tf.compat.v1.ragged.RaggedTensorValue
+# Skip expensive validation since it's entirely dependent on the
+# implementation correctness given that the input RecordBatch is valid.
+_RaggedTensorFromRowSplits = functools.partial(
+    tf.RaggedTensor.from_row_splits, validate=False)
+
 
 class TensorAdapterConfig(object):
   """Config to a TensorAdapter.
 
   Contains all the information needed to create a TensorAdapter.
+
+  `max_workers`, if greater than 1, is the number of threads the TensorAdapter
+  may use to convert the tensors of a RecordBatch concurrently. This mostly
+  pays off for RecordBatches with many (large) tensors, as most of the
+  conversion work is done by Arrow and NumPy without holding the GIL. The
+  threads only produce ndarrays (and Tensor value objects); eager tensors are
+  created from those on the calling thread, so that its (thread-local)
+  `tf.device` scopes apply. The thread pool is shut down when the TensorAdapter
+  is deleted, and is not pickled: an unpickled TensorAdapter creates its own.
   """
 
   def __init__(
@@ -41,10 +68,12 @@ class TensorAdapterConfig(object):
       arrow_schema: pa.Schema,
       tensor_representations: TensorRepresentations,
       original_type_specs: Optional[Dict[Text,
-                                         common_types.TensorTypeSpec]] = None):
+                                         common_types.TensorTypeSpec]] = None,
+      max_workers: Optional[int] = None):
     self.arrow_schema = arrow_schema
     self.tensor_representations = tensor_representations
     self.original_type_specs = original_type_specs
+    self.max_workers = max_workers
 
   # See b/167128119 for the reason behind custom pickle/unpickle
   # implementations.
@@ -52,7 +81,7 @@ class TensorAdapterConfig(object):
     return (self.arrow_schema, {
         k: v.SerializeToString()
         for k, v in self.tensor_representations.items()
-    }, self.original_type_specs)
+    }, self.original_type_specs, self.max_workers)
 
   def __setstate__(self, t):
     tensor_representations = {}
@@ -60,7 +89,9 @@ class TensorAdapterConfig(object):
       r = schema_pb2.TensorRepresentation()
       r.ParseFromString(v)
       tensor_representations[k] = r
-    self.__init__(t[0], tensor_representations, t[2])
+    # States pickled before `max_workers` was introduced have 3 elements.
+    max_workers = t[3] if len(t) > 3 else None
+    self.__init__(t[0], tensor_representations, t[2], max_workers)
 
 
 class TensorAdapter(object):
@@ -83,19 +114,31 @@ class TensorAdapter(object):
   self.TypeSpecs()[tensor_name].is_compatible_with(
       self.ToBatchedTensors(...)[tensor_name])
 
-  Sliced RecordBatches and LargeListArray columns having null elements backed by
-  non-empty sub-lists are not supported and will yield undefined behaviour.
+  LargeListArray columns having null elements backed by non-empty sub-lists are
+  not supported and will yield undefined behaviour.
   """
 
   __slots__ = [
-      "_arrow_schema", "_type_handlers", "_type_specs", "_original_type_specs"
+      "_arrow_schema", "_type_handlers", "_type_specs", "_original_type_specs",
+      "_executor", "_type_handlers_by_name",
+      "_tensor_names", "_config", "_column_indices"
   ]
 
   def __init__(self, config: TensorAdapterConfig):
 
+    self._config = config
     self._arrow_schema = config.arrow_schema
-    self._type_handlers = _BuildTypeHandlers(config.tensor_representations,
-                                             config.arrow_schema)
+    self._type_handlers = tuple(
+        _BuildTypeHandlers(config.tensor_representations, config.arrow_schema))
+    self._type_handlers_by_name = dict(self._type_handlers)
+    self._tensor_names = tuple(
+        tensor_name for tensor_name, _ in self._type_handlers)
+    # Only the columns used by the handlers are fetched from RecordBatches.
+    self._column_indices = tuple(
+        sorted({
+            i for _, handler in self._type_handlers
+            for i in handler.column_indices
+        }))
     self._type_specs = {
         tensor_name: handler.type_spec
         for tensor_name, handler in self._type_handlers
@@ -113,6 +156,24 @@ class TensorAdapter(object):
             "TensorRepresentations. But for tensor {}, got {} vs {}".format(
                 tensor_name, original_type_spec, type_spec))
 
+    # Created last so that an invalid config does not leave a pool behind.
+    self._executor = None
+    if (config.max_workers is not None and config.max_workers > 1 and
+        len(self._type_handlers) > _MAX_TENSORS_FOR_SERIAL_CONVERSION):
+      self._executor = futures.ThreadPoolExecutor(
+          max_workers=config.max_workers)
+
+  def __del__(self):
+    # The executor is not set if __init__() raised before creating it.
+    executor = getattr(self, "_executor", None)
+    if executor is not None:
+      executor.shutdown(wait=False)
+
+  def __reduce__(self):
+    # The thread pool cannot be pickled, so the TensorAdapter is re-created
+    # from its config instead.
+    return TensorAdapter, (self._config,)
+
   def OriginalTypeSpecs(self) -> Dict[Text, common_types.TensorTypeSpec]:
     """Returns the origin's type specs.
 
@@ -147,26 +208,175 @@ class TensorAdapter(object):
         eagerly.
       ValueError: when Any handler failed to produce a Tensor.
     """
+    return dict(
+        zip(self._tensor_names,
+            self._GetTensors(record_batch, produce_eager_tensors)))
+
+  def ToBatchTensorsTuple(
+      self,
+      record_batch: pa.RecordBatch,
+      produce_eager_tensors: Optional[bool] = None) -> Tuple[Any, ...]:
+    """Returns a batch of tensors translated from `record_batch` as a tuple.
+
+    Same as ToBatchTensors(), except that the tensors are returned in a tuple,
+    in the same order as the keys of TypeSpecs(), which spares building a
+    Dict for every RecordBatch.
+
+    Args:
+      record_batch: input RecordBatch.
+      produce_eager_tensors: controls whether the ToBatchTensorsTuple()
+        produces eager tensors or ndarrays (or Tensor value objects). If None,
+        determine that from whether TF Eager mode is enabled.
+
+    Raises:
+      RuntimeError: when Eager Tensors are requested but TF is not executing
+        eagerly.
+      ValueError: when Any handler failed to produce a Tensor.
+    """
+    return tuple(self._GetTensors(record_batch, produce_eager_tensors))
+
+  def _GetTensors(self, record_batch: pa.RecordBatch,
+                  produce_eager_tensors: Optional[bool]) -> List[Any]:
+    """Returns the tensors translated from `record_batch`, in handler order."""
+    produce_eager_tensors = _ResolveProduceEagerTensors(produce_eager_tensors)
+    self._ValidateSchema(record_batch.schema)
+    columns = {i: record_batch.column(i) for i in self._column_indices}
+    batch_size = record_batch.num_rows
+    if self._executor is None:
+      return [
+          _GetTensor(tensor_name, handler, columns, batch_size,
+                     produce_eager_tensors)
+          for tensor_name, handler in self._type_handlers
+      ]
+
+    # `tf.device` scopes are thread-local, so the threads only produce
+    # ndarrays (and Tensor value objects), which are converted to eager tensors
+    # on the calling thread.
+    pending = [
+        self._executor.submit(_GetTensor, tensor_name, handler, columns,
+                              batch_size, False)
+        for tensor_name, handler in self._type_handlers
+    ]
+    if not produce_eager_tensors:
+      return [future.result() for future in pending]
+    return [
+        _ToEagerTensor(tensor_name, future.result())
+        for tensor_name, future in zip(self._tensor_names, pending)
+    ]
+
+  def ToLazyBatchTensors(
+      self,
+      record_batch: pa.RecordBatch,
+      produce_eager_tensors: Optional[bool] = None) -> Mapping[Text, Any]:
+    """Returns a lazily translated batch of tensors from `record_batch`.
+
+    Same as ToBatchTensors(), except that the result is a read-only Mapping
+    that only translates a tensor when it is looked up for the first time (and
+    caches it). Tensors that are never looked up are never translated.
 
-    tf_executing_eagerly = tf.executing_eagerly()
-    if produce_eager_tensors and not tf_executing_eagerly:
-      raise RuntimeError(
-          "Eager Tensors were requested but eager mode was not enabled.")
-    if produce_eager_tensors is None:
-      produce_eager_tensors = tf_executing_eagerly
+    Whether eager tensors are produced is determined at the time of this call,
+    not when the tensors are looked up. Note that the result keeps
+    `record_batch` alive until it is deleted.
+
+    Args:
+      record_batch: input RecordBatch.
+      produce_eager_tensors: controls whether the translated tensors are eager
+        tensors or ndarrays (or Tensor value objects). If None, determine that
+        from whether TF Eager mode is enabled.
 
-    if not record_batch.schema.equals(self._arrow_schema):
+    Raises:
+      RuntimeError: when Eager Tensors are requested but TF is not executing
+        eagerly.
+      ValueError: (upon lookup) when the handler failed to produce the Tensor.
+    """
+    produce_eager_tensors = _ResolveProduceEagerTensors(produce_eager_tensors)
+    self._ValidateSchema(record_batch.schema)
+    return _LazyBatchTensors(self._type_handlers_by_name, record_batch,
+                             produce_eager_tensors)
+
+  def _ValidateSchema(self, schema: pa.Schema) -> None:
+    """Raises if `schema` is not equal to the schema given at construction."""
+    if not schema.equals(self._arrow_schema):
       raise ValueError("Expected same schema.")
-    result = {}
-    for tensor_name, handler in self._type_handlers:
-      try:
-        result[tensor_name] = handler.GetTensor(record_batch,
-                                                produce_eager_tensors)
-      except Exception as e:
-        raise ValueError(
-            "Error raised when handling tensor '{}'".format(tensor_name)) from e
 
-    return result
+
+class _LazyBatchTensors(collections.abc.Mapping):
+  """A Mapping of tensor names to tensors translated upon first lookup."""
+
+  __slots__ = [
+      "_type_handlers", "_record_batch", "_produce_eager_tensors", "_tensors"
+  ]
+
+  def __init__(self, type_handlers: Dict[Text, "_TypeHandler"],
+               record_batch: pa.RecordBatch, produce_eager_tensors: bool):
+    self._type_handlers = type_handlers
+    self._record_batch = record_batch
+    self._produce_eager_tensors = produce_eager_tensors
+    self._tensors = {}
+
+  def __getitem__(self, tensor_name: Text) -> Any:
+    tensor = self._tensors.get(tensor_name)
+    if tensor is None:
+      handler = self._type_handlers[tensor_name]
+      # Only the columns of the handler are fetched from the RecordBatch.
+      record_batch = self._record_batch
+      columns = {i: record_batch.column(i) for i in handler.column_indices}
+      tensor = _GetTensor(tensor_name, handler, columns, record_batch.num_rows,
+                          self._produce_eager_tensors)
+      self._tensors[tensor_name] = tensor
+    return tensor
+
+  def __contains__(self, tensor_name: Any) -> bool:
+    # Mapping.__contains__() would translate the tensor.
+    return tensor_name in self._type_handlers
+
+  def __iter__(self) -> Iterator[Text]:
+    return iter(self._type_handlers)
+
+  def __len__(self) -> int:
+    return len(self._type_handlers)
+
+
+def _ResolveProduceEagerTensors(produce_eager_tensors: Optional[bool]) -> bool:
+  """Resolves the `produce_eager_tensors` argument of ToBatchTensors()."""
+  # The result indexes the tensor factories, so it must be a genuine bool (and
+  # not e.g. a np.bool_).
+  if produce_eager_tensors is None:
+    return bool(tf.executing_eagerly())
+  if produce_eager_tensors and not tf.executing_eagerly():
+    raise RuntimeError(
+        "Eager Tensors were requested but eager mode was not enabled.")
+  return bool(produce_eager_tensors)
+
+
+def _GetTensor(tensor_name: Text, handler: "_TypeHandler",
+               columns: Mapping[int, pa.Array], batch_size: int,
+               produce_eager_tensors: bool) -> Any:
+  """Calls `handler.GetTensor()`, attributing any error to `tensor_name`."""
+  try:
+    return handler.GetTensor(columns, batch_size, produce_eager_tensors)
+  except Exception as e:
+    raise ValueError(
+        "Error raised when handling tensor '{}'".format(tensor_name)) from e
+
+
+def _ToEagerTensor(tensor_name: Text, value: Any) -> Any:
+  """Converts a non-eager result of `_GetTensor()` to an eager tensor."""
+  try:
+    return _ValueToEagerTensor(value)
+  except Exception as e:
+    raise ValueError(
+        "Error raised when handling tensor '{}'".format(tensor_name)) from e
+
+
+def _ValueToEagerTensor(value: Any) -> Any:
+  """Recursively converts ndarrays and Tensor value objects to tensors."""
+  if isinstance(value, _SparseTensorValue):
+    return _MakeSparseTensor(value.indices, value.dense_shape, value.values)
+  if isinstance(value, _RaggedTensorValue):
+    return _RaggedTensorFromRowSplits(
+        _ValueToEagerTensor(value.values), row_splits=value.row_splits)
+  return _ConvertToTensor(value)
 
 
 class _TypeHandler(abc.ABC):
@@ -179,11 +389,12 @@ class _TypeHandler(abc.ABC):
   _TYPE_HANDLER_MAP.
   """
 
-  __slots__ = []
+  __slots__ = ["_type_spec", "_column_indices"]
 
   @abc.abstractmethod
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
     """Initializer.
 
     It can be assumed that CanHandle(arrow_schema, tensor_representation) would
@@ -194,24 +405,39 @@ class _TypeHandler(abc.ABC):
         self.GetTensor() will take conform to.
       tensor_representation: the TensorRepresentation that determines the
         conversion.
+      field_indices: a mapping from the top-level field names of `arrow_schema`
+        to their indices, as returned by _GetFieldIndices().
     """
 
   @property
   def type_spec(self) -> common_types.TensorTypeSpec:
-    """Returns the TypeSpec of the converted Tensor or CompositeTensor."""
-    raise NotImplementedError
+    """Returns the TypeSpec of the converted Tensor or CompositeTensor.
+
+    Sub-classes must set self._type_spec at initialization time.
+    """
+    return self._type_spec
+
+  @property
+  def column_indices(self) -> Tuple[int, ...]:
+    """Returns the indices of the columns that GetTensor() reads.
+
+    Sub-classes must set self._column_indices at initialization time.
+    """
+    return self._column_indices
 
   @abc.abstractmethod
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Any:
-    """Converts the RecordBatch to Tensor or CompositeTensor.
+    """Converts the columns of a RecordBatch to Tensor or CompositeTensor.
 
     The result must be of the same (not only compatible) TypeSpec as
     self.type_spec.
 
     Args:
-      record_batch: a RecordBatch that is of the same Schema as what was passed
-        at initialization time.
+      columns: a mapping from (at least) self.column_indices to the columns of
+        a RecordBatch that is of the same Schema as what was passed at
+        initialization time.
+      batch_size: the number of rows of that RecordBatch.
       produce_eager_tensors: if True, returns Eager Tensors, otherwise returns
         ndarrays or Tensor value objects.
 
@@ -231,30 +457,31 @@ class _BaseDenseTensorHandler(_TypeHandler):
   """Base class of DenseTensorHandlers."""
 
   __slots__ = [
-      "_column_index", "_dtype", "_shape", "_unbatched_flat_len",
-      "_convert_to_binary_fn"
+      "_column_index", "_dtype", "_shape", "_unbatched_shape",
+      "_unbatched_flat_len", "_values_to_numpy_fn"
   ]
 
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
-    super().__init__(arrow_schema, tensor_representation)
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
+    super().__init__(arrow_schema, tensor_representation, field_indices)
     dense_rep = tensor_representation.dense_tensor
     column_name = dense_rep.column_name
-    self._column_index = arrow_schema.get_field_index(column_name)
+    self._column_index = field_indices[column_name]
+    self._column_indices = (self._column_index,)
     _, value_type = _GetNestDepthAndValueType(arrow_schema,
                                               path.ColumnPath(column_name))
     self._dtype = _ArrowTypeToTfDtype(value_type)
-    self._convert_to_binary_fn = _GetConvertToBinaryFn(value_type)
+    self._values_to_numpy_fn = _GetValuesToNumpyFn(value_type)
     unbatched_shape = [
         d.size for d in tensor_representation.dense_tensor.shape.dim
     ]
     self._shape = [None] + unbatched_shape
+    self._unbatched_shape = tuple(unbatched_shape)
     self._unbatched_flat_len = int(np.prod(unbatched_shape, initial=1))
-
-  @property
-  def type_spec(self) -> common_types.TensorTypeSpec:
     # TF's type stub is not correct about TypeSpec and its sub-classes.
-    return typing.cast(tf.TypeSpec, tf.TensorSpec(self._shape, self._dtype))
+    self._type_spec = typing.cast(tf.TypeSpec,
+                                  tf.TensorSpec(self._shape, self._dtype))
 
   def _ListArrayToTensor(
       self, list_array: pa.Array,
@@ -273,13 +500,10 @@ class _BaseDenseTensorHandler(_TypeHandler):
           .format(
               type(list_array), self.type_spec, expected_num_elements,
               len(values)))
-    actual_shape = list(self._shape)
-    actual_shape[0] = batch_size
-    if self._convert_to_binary_fn is not None:
-      values = self._convert_to_binary_fn(values)
-    values_np = np.asarray(values).reshape(actual_shape)
+    values_np = self._values_to_numpy_fn(values).reshape(
+        (batch_size,) + self._unbatched_shape)
     if produce_eager_tensors:
-      return tf.convert_to_tensor(values_np)
+      return _ConvertToTensor(values_np)
 
     return values_np
 
@@ -299,9 +523,9 @@ class _DenseTensorHandler(_BaseDenseTensorHandler):
 
   __slots__ = []
 
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Union[np.ndarray, tf.Tensor]:
-    column = record_batch.column(self._column_index)
+    column = columns[self._column_index]
     return self._ListArrayToTensor(column, produce_eager_tensors)
 
   @staticmethod
@@ -318,19 +542,21 @@ class _DefaultFillingDenseTensorHandler(_BaseDenseTensorHandler):
   __slots__ = ["_default_fill"]
 
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
-    super().__init__(arrow_schema, tensor_representation)
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
+    super().__init__(arrow_schema, tensor_representation, field_indices)
     _, value_type = _GetNestDepthAndValueType(
         arrow_schema,
         path.ColumnPath(tensor_representation.dense_tensor.column_name))
     self._default_fill = _GetDefaultFill(
-        self._shape[1:], value_type,
+        list(self._unbatched_shape), value_type,
         tensor_representation.dense_tensor.default_value)
 
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Union[np.ndarray, tf.Tensor]:
-    column = record_batch.column(self._column_index)
-    column = array_util.FillNullLists(column, self._default_fill)
+    column = columns[self._column_index]
+    if column.null_count != 0:
+      column = array_util.FillNullLists(column, self._default_fill)
     return self._ListArrayToTensor(column, produce_eager_tensors)
 
   @staticmethod
@@ -344,42 +570,53 @@ class _DefaultFillingDenseTensorHandler(_BaseDenseTensorHandler):
 class _VarLenSparseTensorHandler(_TypeHandler):
   """Handles conversion to varlen sparse."""
 
-  __slots__ = ["_column_index", "_dtype", "_convert_to_binary_fn"]
+  __slots__ = ["_column_index", "_dtype", "_binary_view_type"]
 
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
-    super().__init__(arrow_schema, tensor_representation)
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
+    super().__init__(arrow_schema, tensor_representation, field_indices)
     column_name = tensor_representation.varlen_sparse_tensor.column_name
-    self._column_index = arrow_schema.get_field_index(column_name)
+    self._column_index = field_indices[column_name]
+    self._column_indices = (self._column_index,)
     _, value_type = _GetNestDepthAndValueType(arrow_schema,
                                               path.ColumnPath(column_name))
     self._dtype = _ArrowTypeToTfDtype(value_type)
-    self._convert_to_binary_fn = _GetConvertToBinaryFn(value_type)
-
-  @property
-  def type_spec(self) -> common_types.TensorTypeSpec:
-    return typing.cast(
+    self._binary_view_type = _GetBinaryViewType(value_type)
+    self._type_spec = typing.cast(
         tf.TypeSpec,
         tf.SparseTensorSpec(tf.TensorShape([None, None]), self._dtype))
 
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Any:
-    array = record_batch.column(self._column_index)
-    coo_array, dense_shape_array = array_util.CooFromListArray(array)
-    dense_shape_np = dense_shape_array.to_numpy()
-    values_array = array.flatten()
-    if self._convert_to_binary_fn is not None:
-      values_array = self._convert_to_binary_fn(values_array)
+    array = columns[self._column_index]
+    coo_array, _ = array_util.CooFromListArray(array)
+    # The dense shape is the bounding box of the ListArray, which can be read
+    # off its offsets.
+    offsets = array.offsets.to_numpy(zero_copy_only=True)
+    dense_shape_np = np.array(
+        [batch_size, np.max(np.diff(offsets), initial=0)], dtype=np.int64)
+    if array.null_count == 0:
+      # Without null lists, the flattened values are the range of the child
+      # array spanned by the offsets, which can be sliced without copying.
+      values_array = array.values.slice(offsets[0], offsets[-1] - offsets[0])
+    else:
+      values_array = array.flatten()
+    if self._binary_view_type is not None:
+      values_array = values_array.view(self._binary_view_type)
     values_np = np.asarray(values_array)
-    coo_np = coo_array.to_numpy().reshape(values_np.size, 2)
+    # The COO is a flat, null-free Int64Array, so this is a C-contiguous
+    # (num_values, 2) view over its buffer.
+    coo_np = coo_array.to_numpy(zero_copy_only=True).reshape(-1, 2)
+    # The COO spans every value covered by the offsets, including those behind
+    # null lists, while flatten() drops the latter.
+    if coo_np.shape[0] != len(values_np):
+      raise ValueError("Error constructing the COO for SparseTensor. "
+                       "number of values: {}; number of coordinates: {}".format(
+                           len(values_np), coo_np.shape[0]))
 
-    if produce_eager_tensors:
-      return tf.sparse.SparseTensor(
-          indices=tf.convert_to_tensor(coo_np),
-          dense_shape=tf.convert_to_tensor(dense_shape_np),
-          values=tf.convert_to_tensor(values_np))
-    return tf.compat.v1.SparseTensorValue(
-        indices=coo_np, dense_shape=dense_shape_np, values=values_np)
+    return _SPARSE_TENSOR_FACTORIES[produce_eager_tensors](
+        coo_np, dense_shape_np, values_np)
 
   @staticmethod
   def CanHandle(arrow_schema: pa.Schema,
@@ -398,64 +635,68 @@ class _SparseTensorHandler(_TypeHandler):
 
   __slots__ = [
       "_index_column_indices", "_value_column_index", "_shape", "_dtype",
-      "_coo_size", "_convert_to_binary_fn"
+      "_coo_size", "_binary_view_type"
   ]
 
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
-    super().__init__(arrow_schema, tensor_representation)
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
+    super().__init__(arrow_schema, tensor_representation, field_indices)
     sparse_representation = tensor_representation.sparse_tensor
     self._index_column_indices = tuple(
-        arrow_schema.get_field_index(c)
-        for c in sparse_representation.index_column_names)
-    self._value_column_index = arrow_schema.get_field_index(
-        sparse_representation.value_column_name)
+        field_indices[c] for c in sparse_representation.index_column_names)
+    self._value_column_index = field_indices[
+        sparse_representation.value_column_name]
+    self._column_indices = tuple(
+        sorted({self._value_column_index}.union(self._index_column_indices)))
     self._shape = [dim.size for dim in sparse_representation.dense_shape.dim]
     _, value_type = _GetNestDepthAndValueType(
         arrow_schema, path.ColumnPath(sparse_representation.value_column_name))
     self._dtype = _ArrowTypeToTfDtype(value_type)
     self._coo_size = len(self._shape) + 1
-    self._convert_to_binary_fn = _GetConvertToBinaryFn(value_type)
-
-  @property
-  def type_spec(self) -> common_types.TensorTypeSpec:
+    self._binary_view_type = _GetBinaryViewType(value_type)
     batched_shape = [None] + [dim if dim != -1 else None for dim in self._shape]
-    return typing.cast(
+    self._type_spec = typing.cast(
         tf.TypeSpec,
         tf.SparseTensorSpec(tf.TensorShape(batched_shape), self._dtype))
 
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Any:
-    values_array = record_batch.column(self._value_column_index)
-    values_parent_indices = array_util.GetFlattenedArrayParentIndices(
-        values_array)
-    indices_arrays = [np.asarray(values_parent_indices)]
-    for index_column_index in self._index_column_indices:
-      indices_arrays.append(
-          np.asarray(record_batch.column(index_column_index).flatten()))
+    values_array = columns[self._value_column_index]
     flat_values_array = values_array.flatten()
-    if self._convert_to_binary_fn is not None:
-      flat_values_array = self._convert_to_binary_fn(flat_values_array)
+    if self._binary_view_type is not None:
+      flat_values_array = flat_values_array.view(self._binary_view_type)
     values_np = np.asarray(flat_values_array)
-    coo_np = np.empty(shape=(len(values_np), self._coo_size), dtype=np.int64)
-    try:
-      np.stack(indices_arrays, axis=1, out=coo_np)
-    except ValueError as e:
-      raise ValueError("Error constructing the COO for SparseTensor. "
-                       "number of values: {}; "
-                       "size of each index array: {}".format(
-                           len(values_np),
-                           [len(i) for i in indices_arrays])) from e
+    num_values = len(values_np)
 
-    dense_shape = [len(record_batch)] + self._shape
+    # Each index array is written directly into its column of the COO,
+    # casting to int64 on the fly. The first one holds the row each value
+    # belongs to, which is repeated as many times as the length of the row.
+    coo_np = np.empty(shape=(num_values, self._coo_size), dtype=np.int64)
+    row_lengths = np.diff(values_array.offsets.to_numpy(zero_copy_only=True))
+    self._CopyToCooColumn(
+        coo_np, 0, np.repeat(np.arange(batch_size, dtype=np.int64),
+                             row_lengths))
+    for i, index_column_index in enumerate(self._index_column_indices, 1):
+      self._CopyToCooColumn(
+          coo_np, i, np.asarray(columns[index_column_index].flatten()))
 
-    if produce_eager_tensors:
-      return tf.sparse.SparseTensor(
-          indices=tf.convert_to_tensor(coo_np),
-          dense_shape=tf.convert_to_tensor(dense_shape, dtype=tf.int64),
-          values=tf.convert_to_tensor(values_np))
-    return tf.compat.v1.SparseTensorValue(
-        indices=coo_np, dense_shape=dense_shape, values=values_np)
+    dense_shape = [batch_size] + self._shape
+
+    return _SPARSE_TENSOR_FACTORIES[produce_eager_tensors](coo_np, dense_shape,
+                                                           values_np)
+
+  @staticmethod
+  def _CopyToCooColumn(coo_np: np.ndarray, coo_column: int,
+                       index_array: np.ndarray) -> None:
+    """Copies `index_array` into the `coo_column`-th column of `coo_np`."""
+    # Checked explicitly because np.copyto() would broadcast a length-1 array.
+    if len(index_array) != len(coo_np):
+      raise ValueError("Error constructing the COO for SparseTensor. "
+                       "number of values: {}; "
+                       "size of index array {}: {}".format(
+                           len(coo_np), coo_column, len(index_array)))
+    np.copyto(coo_np[:, coo_column], index_array, casting="unsafe")
 
   @staticmethod
   def CanHandle(arrow_schema: pa.Schema,
@@ -486,26 +727,32 @@ class _RaggedTensorHandler(_TypeHandler):
       "_value_path",
       "_dtype",
       "_row_partition_dtype",
-      "_convert_to_binary_fn",
+      "_offsets_dtype",
+      "_binary_view_type",
       "_inner_fixed_shape",
       "_values_fixed_shape",
       "_inferred_dimensions_elements",
       "_outer_ragged_rank",
       "_ragged_partitions",
       "_fixed_dimension_partitions",
+      "_top_level_field_indices",
+      "_path_steps",
   ]
 
   def __init__(self, arrow_schema: pa.Schema,
-               tensor_representation: schema_pb2.TensorRepresentation):
-    super().__init__(arrow_schema, tensor_representation)
+               tensor_representation: schema_pb2.TensorRepresentation,
+               field_indices: Dict[Text, int]):
+    super().__init__(arrow_schema, tensor_representation, field_indices)
     ragged_representation = tensor_representation.ragged_tensor
 
     self._value_path = path.ColumnPath.from_proto(
         ragged_representation.feature_path)
-    self._column_index = arrow_schema.get_field_index(
-        ragged_representation.feature_path.step[0])
+    self._column_index = field_indices[
+        ragged_representation.feature_path.step[0]]
     self._outer_ragged_rank, value_type = _GetNestDepthAndValueType(
         arrow_schema, self._value_path)
+    self._path_steps = _GetRaggedPathSteps(
+        arrow_schema.field(self._column_index).type, self._value_path.suffix(1))
 
     # Split partitions to the ones defining Ragged dimensions and the ones
     # defining the outer dimensions shape (through uniform row length
@@ -523,6 +770,17 @@ class _RaggedTensorHandler(_TypeHandler):
         ragged_partitions.append(partition)
     self._ragged_partitions = ragged_partitions[::-1]
     self._fixed_dimension_partitions = fixed_dimension_partitions[::-1]
+    # Row length features of partitions are looked up by name in the parent of
+    # the values. When that parent is the RecordBatch itself, they are
+    # top-level columns.
+    self._top_level_field_indices = {
+        p.row_length: field_indices.get(p.row_length, -1)
+        for p in self._ragged_partitions
+        if p.HasField("row_length")
+    }
+    self._column_indices = tuple(
+        sorted({self._column_index}.union(
+            i for i in self._top_level_field_indices.values() if i >= 0)))
 
     inner_fixed_shape = []
     inferred_dimensions_elements = 1
@@ -535,17 +793,18 @@ class _RaggedTensorHandler(_TypeHandler):
 
     self._dtype = _ArrowTypeToTfDtype(value_type)
     self._row_partition_dtype = ragged_representation.row_partition_dtype
-    self._convert_to_binary_fn = _GetConvertToBinaryFn(value_type)
-
-  @property
-  def type_spec(self) -> common_types.TensorTypeSpec:
-    row_splits_dtype = tf.int64
     if (self._row_partition_dtype ==
         schema_pb2.TensorRepresentation.RowPartitionDType.INT32):
+      self._offsets_dtype = np.int32
       row_splits_dtype = tf.int32
+    else:
+      self._offsets_dtype = np.int64
+      row_splits_dtype = tf.int64
+    self._binary_view_type = _GetBinaryViewType(value_type)
+
     ragged_rank = self._outer_ragged_rank + len(self._ragged_partitions)
     shape = [None] * (ragged_rank + 1) + self._inner_fixed_shape
-    return typing.cast(
+    self._type_spec = typing.cast(
         tf.TypeSpec,
         tf.RaggedTensorSpec(
             shape,
@@ -553,24 +812,10 @@ class _RaggedTensorHandler(_TypeHandler):
             ragged_rank=ragged_rank,
             row_splits_dtype=row_splits_dtype))
 
-  def GetTensor(self, record_batch: pa.RecordBatch,
+  def GetTensor(self, columns: Mapping[int, pa.Array], batch_size: int,
                 produce_eager_tensors: bool) -> Union[np.ndarray, tf.Tensor]:
-    if (self._row_partition_dtype ==
-        schema_pb2.TensorRepresentation.RowPartitionDType.INT32):
-      offsets_dtype = np.int32
-    elif (self._row_partition_dtype ==
-          schema_pb2.TensorRepresentation.RowPartitionDType.INT64 or
-          self._row_partition_dtype ==
-          schema_pb2.TensorRepresentation.RowPartitionDType.UNSPECIFIED):
-      offsets_dtype = np.int64
-
-    if produce_eager_tensors:
-      # Skip expensive validation since it's entirely dependent on the
-      # implementation correctness given that the input RecordBatch is valid.
-      factory = functools.partial(
-          tf.RaggedTensor.from_row_splits, validate=False)
-    else:
-      factory = tf.compat.v1.ragged.RaggedTensorValue
+    offsets_dtype = self._offsets_dtype
+    factory = _RAGGED_TENSOR_FACTORIES[produce_eager_tensors]
 
     # A RaggedTensor is composed by the following dimensions:
     # [B, D_0, D_1, ..., D_N, P_0, P_1, ..., P_M, U_0, U_1, ..., U_P]
@@ -589,43 +834,31 @@ class _RaggedTensorHandler(_TypeHandler):
     # of the nested structure on the dataset schema.
     outer_row_splits = []
 
-    column_path = self._value_path.suffix(1)
-    column = record_batch.column(self._column_index)
-    column_type = column.type
+    column = columns[self._column_index]
     # Keep track of an accessor for the parent struct, so we can access other
     # fields required to get future dimensions row splits.
-    parent_field_accessor = lambda field: record_batch.column(  # pylint:disable=g-long-lambda
-        record_batch.schema.get_field_index(field))
-
-    while True:
-      # TODO(b/156514075): add support for handling slices.
-      if column.offset != 0:
-        raise ValueError(
-            "This record batch is sliced. We currently do not handle converting"
-            " slices to RaggedTensors.")
-      if pa.types.is_struct(column_type):
-        parent_column = column
-        parent_field_accessor = parent_column.field
-        column = column.field(column_path.initial_step())
-        column_path = column_path.suffix(1)
-        column_type = column.type
-      elif _IsListLike(column_type):
-        # Note that we are using raw offsets and values assuming that the array
-        # is not sliced (validated above) and there is no null elements backed
-        # by non-empty lists (too expensive to validate).
-        outer_row_splits.append(np.asarray(column.offsets, dtype=offsets_dtype))
-        column = column.values
-        column_type = column.type
+    parent_field_accessor = (
+        lambda field: columns[self._top_level_field_indices[field]])
+
+    for step in self._path_steps:
+      if step is None:
+        # Note that we are using raw offsets and values assuming that there is
+        # no null elements backed by non-empty lists (too expensive to
+        # validate).
+        row_splits, column = _GetRowSplitsAndValues(column, offsets_dtype)
+        outer_row_splits.append(row_splits)
       else:
-        break
+        # Note that the child of a sliced StructArray is sliced accordingly.
+        parent_field_accessor = column.field
+        column = column.field(step)
 
     # Now that we have stored the row splits for the Dn dimensions, lets
     # start the construction of the RaggedTensor from the inner dimensions to
     # the outermost.
 
     # Take the values and set the shape for the inner most dimensions (Up)
-    if self._convert_to_binary_fn is not None:
-      column = self._convert_to_binary_fn(column)
+    if self._binary_view_type is not None:
+      column = column.view(self._binary_view_type)
     ragged_tensor = np.reshape(np.asarray(column), self._values_fixed_shape)
 
     # Build the RaggedTensor from the values and the specified partitions.
@@ -679,11 +912,11 @@ class _RaggedTensorHandler(_TypeHandler):
         # from another array other than values, we need to update the last
         # dimension row splits defined by the nested structure (D_n) given the
         # offsets of the array.
-        outer_last_row_split = np.asarray(
-            row_length_array.offsets, dtype=offsets_dtype)
+        outer_last_row_split, row_length_values = _GetRowSplitsAndValues(
+            row_length_array, offsets_dtype)
 
         # Build row splits.
-        row_length = np.asarray(row_length_array.flatten())
+        row_length = np.asarray(row_length_values)
         row_splits = np.zeros(len(row_length) + 1, dtype=offsets_dtype)
         np.cumsum(row_length, out=row_splits[1:])
 
@@ -780,6 +1013,27 @@ class _RaggedTensorHandler(_TypeHandler):
     return True
 
 
+def _MakeSparseTensorValue(
+    indices: np.ndarray, dense_shape: Union[np.ndarray, List[int]],
+    values: np.ndarray) -> tf.compat.v1.SparseTensorValue:
+  return _SparseTensorValue(
+      indices=indices, dense_shape=dense_shape, values=values)
+
+
+def _MakeSparseTensor(indices: np.ndarray,
+                      dense_shape: Union[np.ndarray, List[int]],
+                      values: np.ndarray) -> tf.SparseTensor:
+  # The SparseTensor constructor converts its components to (int64 for indices
+  # and dense_shape) tensors by itself.
+  return _SparseTensor(
+      indices=indices, dense_shape=dense_shape, values=values)
+
+
+# Constructors of the results of the SparseTensor and RaggedTensor handlers,
+# indexed by `produce_eager_tensors`.
+_SPARSE_TENSOR_FACTORIES = (_MakeSparseTensorValue, _MakeSparseTensor)
+_RAGGED_TENSOR_FACTORIES = (_RaggedTensorValue, _RaggedTensorFromRowSplits)
+
 # Mapping from TensorRepresentation's "kind" oneof field name to TypeHandler
 # classes. Note that one kind may have multiple handlers and the first one
 # whose CanHandle() returns true will be used.
@@ -795,6 +1049,7 @@ def _BuildTypeHandlers(
     tensor_representations: Dict[Text, schema_pb2.TensorRepresentation],
     arrow_schema: pa.Schema) -> List[Tuple[Text, _TypeHandler]]:
   """Builds type handlers according to TensorRepresentations."""
+  field_indices = _GetFieldIndices(arrow_schema)
   result = []
   for tensor_name, rep in tensor_representations.items():
     potential_handlers = _TYPE_HANDLER_MAP.get(rep.WhichOneof("kind"))
@@ -805,7 +1060,7 @@ def _BuildTypeHandlers(
     for h in potential_handlers:
       if h.CanHandle(arrow_schema, rep):
         found_handler = True
-        result.append((tensor_name, h(arrow_schema, rep)))
+        result.append((tensor_name, h(arrow_schema, rep, field_indices)))
         break
     if not found_handler:
       raise ValueError("Unable to handle tensor {} with rep {} "
@@ -815,6 +1070,49 @@ def _BuildTypeHandlers(
   return result
 
 
+def _GetFieldIndices(arrow_schema: pa.Schema) -> Dict[Text, int]:
+  """Returns a mapping from top-level field names to their indices.
+
+  Consistent with pa.Schema.get_field_index(), ambiguous (duplicated) names are
+  mapped to -1.
+
+  Args:
+    arrow_schema: The arrow schema whose fields to index.
+  """
+  result = {}
+  for i, name in enumerate(arrow_schema.names):
+    result[name] = -1 if name in result else i
+  return result
+
+
+def _GetRaggedPathSteps(
+    arrow_type: pa.DataType,
+    column_path: path.ColumnPath) -> Tuple[Optional[int], ...]:
+  """Returns the steps that lead from a column to the values along a path.
+
+  Each step is either None, meaning that the current (list-like) array is
+  replaced by its values, or an int, meaning that the current (struct) array is
+  replaced by its child at that index.
+
+  Args:
+    arrow_type: the type of the column to start from.
+    column_path: the path to the values, relative to the column. It must lead
+      to a leaf field.
+  """
+  steps = []
+  while True:
+    if pa.types.is_struct(arrow_type):
+      child_index = arrow_type.get_field_index(column_path.initial_step())
+      steps.append(child_index)
+      column_path = column_path.suffix(1)
+      arrow_type = arrow_type[child_index].type
+    elif _IsListLike(arrow_type):
+      steps.append(None)
+      arrow_type = arrow_type.value_type
+    else:
+      return tuple(steps)
+
+
 def _IsListLike(arrow_type: pa.DataType) -> bool:
   return pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type)
 
@@ -956,22 +1254,69 @@ def _GetDefaultFill(
   """Returns an Array full of the default value given in the proto."""
 
   size = int(np.prod(unbatched_shape, initial=1))
-  return pa.array(
-      [_GetAllowedDefaultValue(value_type, default_value_proto)] * size,
-      type=value_type)
+  default_value = _GetAllowedDefaultValue(value_type, default_value_proto)
+  if _IsBinaryLike(value_type):
+    fill_dtype = object
+  else:
+    fill_dtype = value_type.to_pandas_dtype()
+  return pa.array(np.full(size, default_value, dtype=fill_dtype),
+                  type=value_type)
 
 
-def _GetConvertToBinaryFn(
-    array_type: pa.DataType) -> Optional[Callable[[pa.Array], pa.Array]]:
-  """Returns a function that converts a StringArray to BinaryArray."""
+def _GetBinaryViewType(array_type: pa.DataType) -> Optional[pa.DataType]:
+  """Returns the binary type a (Large)StringArray should be viewed as."""
 
   if pa.types.is_string(array_type):
-    return lambda array: array.view(pa.binary())
+    return pa.binary()
   if pa.types.is_large_string(array_type):
-    return lambda array: array.view(pa.large_binary())
+    return pa.large_binary()
   return None
 
 
+def _GetRowSplitsAndValues(list_array: pa.Array,
+                           dtype: np.dtype) -> Tuple[np.ndarray, pa.Array]:
+  """Returns the row splits and the values of a list-like array.
+
+  The row splits are the offsets of `list_array` as an ndarray of `dtype`,
+  starting at 0 even if `list_array` is sliced. They are viewed without
+  copying unless `list_array` is sliced or its offsets are not of `dtype`
+  (e.g. int32 offsets of a ListArray requested as int64).
+
+  The values are the range of the child array spanned by the offsets.
+
+  Args:
+    list_array: a ListArray or a LargeListArray.
+    dtype: the desired dtype of the row splits.
+  """
+  offsets = list_array.offsets.to_numpy(zero_copy_only=True)
+  values = list_array.values
+  start, end = offsets[0], offsets[-1]
+  if start != 0 or end != len(values):
+    values = values.slice(start, end - start)
+  if start != 0:
+    offsets = np.subtract(offsets, start, dtype=dtype)
+  elif offsets.dtype != dtype:
+    offsets = offsets.astype(dtype, copy=False)
+  return offsets, values
+
+
+def _GetValuesToNumpyFn(
+    value_type: pa.DataType) -> Callable[[pa.Array], np.ndarray]:
+  """Returns a function that converts an Array of `value_type` to ndarray.
+
+  The function is resolved once per value type so that the per-batch
+  conversion does not need to branch on it.
+
+  Args:
+    value_type: the type of the Arrays to be converted.
+  """
+  # np.asarray() already views null-free primitive values without copying.
+  binary_view_type = _GetBinaryViewType(value_type)
+  if binary_view_type is None:
+    return np.asarray
+  return lambda values: np.asarray(values.view(binary_view_type))
+
+
 def _FloorDivide(array, num_elements: int):
   # The most common trivial case can avoid producing new arrays.
   if num_elements == 1:
@@ -1115,6 +1115,77 @@ _RAGGED_TENSOR_TEST_CASES = (
                 row_splits=np.asarray([0, 2, 2, 2, 3]),
             ),
         ),
+        dict(
+            testcase_name="ListStruct_RaggedRank1Uniform1D_Sliced",
+            tensor_representation_textpb="""
+        ragged_tensor {
+          feature_path {
+            step: "parent"
+            step: "struct"
+            step: "value"
+          }
+          partition { row_length: "row_length" }
+          row_partition_dtype: INT64
+        }
+        """,
+            # Same as ListStruct_RaggedRank1Uniform1D, but the first row is
+            # sliced off.
+            record_batch=pa.RecordBatch.from_arrays([
+                pa.array([
+                    [
+                        {
+                            "struct": {
+                                "value": [9, 9],
+                                "row_length": [2],
+                            }
+                        },
+                    ],
+                    [
+                        {
+                            "struct": {
+                                "value": [1, 2, 3],
+                                "row_length": [2, 1],
+                            }
+                        },
+                        {
+                            "struct": {
+                                "value": [1],
+                                "row_length": [1],
+                            }
+                        },
+                    ],
+                    None,
+                    [],
+                    [
+                        {
+                            "struct": {
+                                "value": [2, 3, 4],
+                                "row_length": [1, 2],
+                            }
+                        },
+                    ],
+                ],
+                         pa.list_(
+                             pa.struct([("struct",
+                                         pa.struct([
+                                             ("value", pa.list_(pa.int64())),
+                                             ("row_length", pa.list_(pa.int64()))
+                                         ]))])))
+            ], ["parent"]).slice(1),
+            expected_type_spec=tf.RaggedTensorSpec(
+                tf.TensorShape([None, None, None, None]),
+                tf.int64,
+                ragged_rank=3,
+                row_splits_dtype=tf.int64),
+            expected_ragged_tensor=tf.compat.v1.ragged.RaggedTensorValue(
+                values=tf.compat.v1.ragged.RaggedTensorValue(
+                    values=tf.compat.v1.ragged.RaggedTensorValue(
+                        values=np.asarray([1, 2, 3, 1, 2, 3, 4]),
+                        row_splits=np.asarray([0, 2, 3, 4, 5, 7])),
+                    row_splits=np.asarray([0, 2, 3, 5])),
+                row_splits=np.asarray([0, 2, 2, 2, 3]),
+            ),
+        ),
     ])
 
 _INVALID_DEFAULT_VALUE_TEST_CASES = [
@@ -1392,6 +1463,115 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
 
     self.assertAdapterCanProduceNonEagerInEagerMode(adapter, record_batch)
 
+  @test_util.run_in_graph_and_eager_modes
+  def testSparseTensorSlicedRecordBatch(self):
+    tensor_representation = text_format.Parse(
+        """
+        sparse_tensor {
+          value_column_name: "values"
+          index_column_names: ["key"]
+          dense_shape {
+            dim {
+              size: 10
+            }
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1, 2], [3], [], [4, 5]], type=pa.list_(pa.int64())),
+        pa.array([[0, 1], [2], [], [3, 4]], type=pa.list_(pa.int64()))
+    ], ["values", "key"])
+    record_batch = record_batch.slice(1, 3)
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           {"output": tensor_representation}))
+    converted = adapter.ToBatchTensors(record_batch)
+    self.assertSparseAllEqual(
+        tf.compat.v1.SparseTensorValue(
+            dense_shape=[3, 10],
+            indices=[[0, 2], [2, 3], [2, 4]],
+            values=tf.convert_to_tensor([3, 4, 5], dtype=tf.int64)),
+        converted["output"])
+    self.assertAdapterCanProduceNonEagerInEagerMode(adapter, record_batch)
+
+  @parameterized.named_parameters(
+      dict(testcase_name="no_null", length=2, expected_dense_shape=[2, 3]),
+      dict(testcase_name="with_null", length=3, expected_dense_shape=[3, 3]))
+  @test_util.run_in_graph_and_eager_modes
+  def testVarLenSparseTensorSlicedRecordBatch(self, length,
+                                              expected_dense_shape):
+    tensor_representation = text_format.Parse(
+        """
+        varlen_sparse_tensor {
+          column_name: "feature"
+        }
+        """, schema_pb2.TensorRepresentation())
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1, 2], [3], [4, 5, 6], None, [7]],
+                 type=pa.list_(pa.int64()))
+    ], ["feature"])
+    record_batch = record_batch.slice(1, length)
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           {"output": tensor_representation}))
+    converted = adapter.ToBatchTensors(record_batch)
+    self.assertSparseAllEqual(
+        tf.compat.v1.SparseTensorValue(
+            dense_shape=expected_dense_shape,
+            indices=[[0, 0], [1, 0], [1, 1], [1, 2]],
+            values=tf.convert_to_tensor([3, 4, 5, 6], dtype=tf.int64)),
+        converted["output"])
+    self.assertAdapterCanProduceNonEagerInEagerMode(adapter, record_batch)
+
+  def testRaiseOnSparseTensorIndexSizeMismatch(self):
+    tensor_representation = text_format.Parse(
+        """
+        sparse_tensor {
+          value_column_name: "values"
+          index_column_names: ["key"]
+          dense_shape {
+            dim {
+              size: 10
+            }
+          }
+        }
+        """, schema_pb2.TensorRepresentation())
+    # A single index for two values must not be broadcast.
+    record_batch = pa.RecordBatch.from_arrays(
+        [pa.array([[1, 2]]), pa.array([[3]])], ["values", "key"])
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           {"output": tensor_representation}))
+    with self.assertRaisesRegex(
+        ValueError, "Error raised when handling tensor 'output'") as cm:
+      adapter.ToBatchTensors(record_batch)
+    self.assertIn("Error constructing the COO for SparseTensor",
+                  str(cm.exception.__cause__))
+
+  def testRaiseOnVarLenSparseTensorNullListWithValues(self):
+    tensor_representation = text_format.Parse(
+        """
+        varlen_sparse_tensor {
+          column_name: "feature"
+        }
+        """, schema_pb2.TensorRepresentation())
+    # [[1, 2], None, [4, 5]], where the null list still spans the value 3.
+    list_array = pa.Array.from_buffers(
+        pa.list_(pa.int64()), 3, [
+            pa.py_buffer(np.array([0b101], dtype=np.uint8)),
+            pa.py_buffer(np.array([0, 2, 3, 5], dtype=np.int32))
+        ],
+        children=[pa.array([1, 2, 3, 4, 5], type=pa.int64())])
+    record_batch = pa.RecordBatch.from_arrays([list_array], ["feature"])
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           {"output": tensor_representation}))
+    with self.assertRaisesRegex(
+        ValueError, "Error raised when handling tensor 'output'") as cm:
+      adapter.ToBatchTensors(record_batch)
+    self.assertIn("Error constructing the COO for SparseTensor",
+                  str(cm.exception.__cause__))
+
   @test_util.run_in_graph_and_eager_modes
   def testSparseTensorsReferSameColumns(self):
     tensor_representation1 = text_format.Parse(
@@ -1656,13 +1836,19 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
     adapter = tensor_adapter.TensorAdapter(
         tensor_adapter.TensorAdapterConfig(record_batch.schema,
                                            {"output": tensor_representation}))
-    with self.assertRaisesRegex(
-        ValueError,
-        ".*Error raised when handling tensor 'output'"):
-      adapter.ToBatchTensors(record_batch)
+    converted = adapter.ToBatchTensors(record_batch)
+    self.assertRaggedAllEqual(
+        converted["output"],
+        tf.compat.v1.ragged.RaggedTensorValue(
+            values=np.asarray([2, 3, 4, 5]),
+            row_splits=np.asarray([0, 0, 1, 4])))
+    self.assertAdapterCanProduceNonEagerInEagerMode(adapter, record_batch)
 
+  @parameterized.named_parameters(
+      dict(testcase_name="serial", max_workers=None),
+      dict(testcase_name="concurrent", max_workers=2))
   @test_util.run_in_graph_and_eager_modes
-  def testMultipleColumns(self):
+  def testMultipleColumns(self, max_workers):
     record_batch = pa.RecordBatch.from_arrays([
         pa.array([[1], [], [2, 3], None], type=pa.large_list(pa.int64())),
         pa.array([[1.0, 2.0], [2.0, 3.0], [3.0, 4.0], [4.0, 5.0]],
@@ -1733,8 +1919,10 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
     }
 
     adapter = tensor_adapter.TensorAdapter(
-        tensor_adapter.TensorAdapterConfig(record_batch.schema,
-                                           tensor_representations))
+        tensor_adapter.TensorAdapterConfig(
+            record_batch.schema,
+            tensor_representations,
+            max_workers=max_workers))
     type_specs = adapter.TypeSpecs()
     self.assertEqual(
         type_specs, {
@@ -1781,8 +1969,65 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
             spec.is_compatible_with(tensors[name]),
             "{} is not compatible with spec {}".format(tensors[name], spec))
 
+    tensors_tuple = adapter.ToBatchTensorsTuple(record_batch)
+    self.assertLen(tensors_tuple, len(type_specs))
+    for name, tensor in zip(type_specs, tensors_tuple):
+      if name.endswith("_dense"):
+        self.assertAllEqual(tensors[name], tensor)
+      else:
+        self.assertSparseAllEqual(tensors[name], tensor)
+
     self.assertAdapterCanProduceNonEagerInEagerMode(adapter, record_batch)
 
+  @test_util.run_in_graph_and_eager_modes
+  def testLazyBatchTensors(self):
+    record_batch = pa.RecordBatch.from_arrays([
+        pa.array([[1], [2]], type=pa.list_(pa.int64())),
+        pa.array([[1.0, 2.0], [3.0]], type=pa.list_(pa.float32())),
+    ], ["dense", "varlen"])
+    tensor_representations = {
+        "dense":
+            text_format.Parse(
+                """
+        dense_tensor {
+          column_name: "dense"
+          shape {
+            dim {
+              size: 1
+            }
+          }
+        }""", schema_pb2.TensorRepresentation()),
+        # Cannot be converted to a dense tensor, which is only noticed upon
+        # lookup.
+        "bad_dense":
+            text_format.Parse(
+                """
+        dense_tensor {
+          column_name: "varlen"
+          shape {
+            dim {
+              size: 1
+            }
+          }
+        }""", schema_pb2.TensorRepresentation()),
+    }
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           tensor_representations))
+    tensors = adapter.ToLazyBatchTensors(record_batch)
+    self.assertLen(tensors, 2)
+    self.assertCountEqual(tensors.keys(), ["dense", "bad_dense"])
+    # Membership tests do not translate the tensor.
+    self.assertIn("bad_dense", tensors)
+    self.assertNotIn("nonexistent", tensors)
+    self.assertAllEqual([[1], [2]], tensors["dense"])
+    self.assertIs(tensors["dense"], tensors["dense"])
+    with self.assertRaisesRegex(ValueError,
+                                "Error raised when handling tensor 'bad_dense'"):
+      _ = tensors["bad_dense"]
+    with self.assertRaises(KeyError):
+      _ = tensors["nonexistent"]
+
   def testRaiseOnUnsupportedTensorRepresentation(self):
     with self.assertRaisesRegex(ValueError, "Unable to handle tensor"):
       tensor_adapter.TensorAdapter(
@@ -1857,6 +2102,27 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
               [pa.array([[1], None, [2]], type=pa.list_(pa.int64()))],
               ["column"]))
 
+  def testRaiseOnSchemaMismatch(self):
+    tensor_representation = text_format.Parse(
+        """
+        varlen_sparse_tensor {
+          column_name: "column"
+        }
+        """, schema_pb2.TensorRepresentation())
+    record_batch = pa.RecordBatch.from_arrays(
+        [pa.array([[1], None, [2]], type=pa.list_(pa.int64()))], ["column"])
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(record_batch.schema,
+                                           {"output": tensor_representation}))
+    # Batches of an equal schema are accepted.
+    adapter.ToBatchTensors(
+        pa.RecordBatch.from_arrays(
+            [pa.array([[3]], type=pa.list_(pa.int64()))], ["column"]))
+    with self.assertRaisesRegex(ValueError, "Expected same schema"):
+      adapter.ToBatchTensors(
+          pa.RecordBatch.from_arrays(
+              [pa.array([[3]], type=pa.list_(pa.int32()))], ["column"]))
+
   def testOriginalTypeSpecs(self):
     arrow_schema = pa.schema([pa.field("column1", pa.list_(pa.int32()))])
     tensor_representations = {
@@ -1920,13 +2186,47 @@ class TensorAdapterTest(parameterized.TestCase, tf.test.TestCase):
         original_type_specs={
             "column1": tf.TensorSpec(dtype=tf.int32, shape=[None, 1]),
             "column2": tf.TensorSpec(dtype=tf.int32, shape=[None, 1])
-        })
+        },
+        max_workers=4)
     unpickled_config = pickle.loads(pickle.dumps(config))
     self.assertEqual(config.arrow_schema, unpickled_config.arrow_schema)
     self.assertEqual(config.tensor_representations,
                      unpickled_config.tensor_representations)
     self.assertEqual(config.original_type_specs,
                      unpickled_config.original_type_specs)
+    self.assertEqual(config.max_workers, unpickled_config.max_workers)
+
+  def testPickleTensorAdapter(self):
+    # Enough tensors for the adapter to use a thread pool.
+    num_columns = 5
+    record_batch = pa.RecordBatch.from_arrays(
+        [pa.array([[i], [i + 1]]) for i in range(num_columns)],
+        ["column{}".format(i) for i in range(num_columns)])
+    tensor_representations = {
+        "column{}".format(i): text_format.Parse(
+            """
+            dense_tensor {{
+              column_name: "column{}"
+              shape {{
+                dim {{
+                  size: 1
+                }}
+              }}
+            }}""".format(i), schema_pb2.TensorRepresentation())
+        for i in range(num_columns)
+    }
+    # The thread pool is re-created upon unpickling.
+    adapter = tensor_adapter.TensorAdapter(
+        tensor_adapter.TensorAdapterConfig(
+            record_batch.schema, tensor_representations, max_workers=2))
+    unpickled_adapter = pickle.loads(pickle.dumps(adapter))
+    self.assertEqual(adapter.TypeSpecs(), unpickled_adapter.TypeSpecs())
+    tensors = adapter.ToBatchTensors(record_batch, produce_eager_tensors=False)
+    unpickled_tensors = unpickled_adapter.ToBatchTensors(
+        record_batch, produce_eager_tensors=False)
+    self.assertCountEqual(tensors.keys(), unpickled_tensors.keys())
+    for name, tensor in tensors.items():
+      self.assertAllEqual(tensor, unpickled_tensors[name])
 
 
 if __name__ == "__main__":